@@ -1,59 +1,167 @@
-from enum import Enum
-import copy
+from array import array
+from collections.abc import Sequence
+from enum import IntEnum
 import random
 
-class Suit(Enum):
-    SPADES = "\u2664"
-    HEARTS = "\u2661"
-    CLUBS = "\u2667"
-    DIAMONDS = "\u2662"
+class Suit(IntEnum):
+    SPADES = 0
+    HEARTS = 1
+    CLUBS = 2
+    DIAMONDS = 3
 
-class PlayerTrumpDecision(Enum):
+SUIT_GLYPH = ("\u2664", "\u2661", "\u2667", "\u2662")
+
+class PlayerTrumpDecision(IntEnum):
     PLAYER = 0
     ALWAYS_ACCEPT = 1
     RANDOM = 2
 
-class PlayerCardDecision(Enum):
+class PlayerCardDecision(IntEnum):
     PLAYER = 0
     RANDOM = 1
 
-class Card:
-    def __init__(self, rank: str, suit: Suit):
-        """Card class constructor to initialize the object
-        
-        Input Arguments:
-        rank -- the rank of the card
-        suit -- the suit of the card
-        """
-        self.rank = rank
-        self.suit = suit
+RANKS = ("9", "10", "J", "Q", "K", "A")
+SUITS = (Suit.SPADES, Suit.HEARTS, Suit.CLUBS, Suit.DIAMONDS)
+
+## Cards are encoded as the integers 0-23 (suit index * 6 + rank index)
+Card = int
+CARD_RANK = tuple(rank for suit in SUITS for rank in RANKS)
+CARD_SUIT = tuple(suit for suit in SUITS for rank in RANKS)
+CARD_STR = tuple(f" {rank}{SUIT_GLYPH[suit]}" for suit in SUITS for rank in RANKS)
+BASE_DECK = bytes(range(len(CARD_STR)))
+
+## The relative ranking of each card in euchre w/o trump
+CARD_VALUE = bytes(RANKS.index(rank) for rank in CARD_RANK)
+
+## The seat to the left of each seat, i.e. the next seat to act, and the seat across from each seat, i.e. its partner
+NEXT_SEAT = (1, 2, 3, 0)
+PARTNER_SEAT = (2, 3, 0, 1)
+
+## The suit of the left bower for each trump suit
+LEFT_BOWER = {Suit.SPADES: Suit.CLUBS, Suit.HEARTS: Suit.DIAMONDS, Suit.CLUBS: Suit.SPADES, Suit.DIAMONDS: Suit.HEARTS}
+
+def get_effective_suit(card: Card, trump_suit: Suit) -> Suit:
+    """Returns the suit the card belongs to once trump is decided, i.e. the left bower counts as trump"""
+    if CARD_RANK[card] == "J" and CARD_SUIT[card] == LEFT_BOWER[trump_suit]:
+        return trump_suit
+    return CARD_SUIT[card]
+
+def get_trump_rank(card: Card, trump_suit: Suit) -> int:
+    """Returns the euchre ranking of the card once trump is decided, every trump card outranks every other card"""
+    if CARD_RANK[card] == "J" and CARD_SUIT[card] == trump_suit:
+        return 13
+    elif CARD_RANK[card] == "J" and CARD_SUIT[card] == LEFT_BOWER[trump_suit]:
+        return 12
+    elif CARD_SUIT[card] == trump_suit:
+        return 6 + CARD_VALUE[card]
+    return CARD_VALUE[card]
+
+## The suit and euchre ranking of every card, for each trump suit
+EFFECTIVE_SUITS = {trump_suit: tuple(get_effective_suit(card, trump_suit) for card in range(len(CARD_STR))) for trump_suit in Suit}
+TRUMP_RANKS = {trump_suit: bytes(get_trump_rank(card, trump_suit) for card in range(len(CARD_STR))) for trump_suit in Suit}
+
+## Bitmask of the cards of each suit, indexed by [trump suit][suit], with the left bower counted as trump
+SUIT_MASKS = tuple(
+    tuple(sum(1 << card for card in range(len(CARD_STR)) if EFFECTIVE_SUITS[trump_suit][card] == suit) for suit in Suit)
+    for trump_suit in Suit)
+
+## Bitmask of the cards that follow suit, indexed by [trump suit][lead card]
+FOLLOW_SUIT_MASKS = tuple(
+    tuple(SUIT_MASKS[trump_suit][EFFECTIVE_SUITS[trump_suit][lead_card]] for lead_card in range(len(CARD_STR)))
+    for trump_suit in Suit)
+
+## The strength of every card within a trick, indexed by [trump suit][lead suit][card], 0 if it neither follows suit nor is trump
+SUIT_TRICK_RANKS = tuple(
+    tuple(
+        bytes(TRUMP_RANKS[trump_suit][card] + 1 if EFFECTIVE_SUITS[trump_suit][card] in (trump_suit, lead_suit) else 0 for card in range(len(CARD_STR)))
+        for lead_suit in Suit)
+    for trump_suit in Suit)
+
+## The same strengths indexed by [trump suit][lead card][card]
+TRICK_RANKS = tuple(
+    tuple(SUIT_TRICK_RANKS[trump_suit][EFFECTIVE_SUITS[trump_suit][lead_card]] for lead_card in range(len(CARD_STR)))
+    for trump_suit in Suit)
+
+## The choices for a random trump call once the up card is hidden, i.e. any other suit or a pass
+TRUMP_CHOICES_EXCLUDING = {suit: tuple(other for other in Suit if other != suit) + (None,) for suit in Suit}
+
+## The points scored by the calling team and the defending team, indexed by the number of tricks the calling team won
+ROUND_SCORES = ((0, 2), (0, 2), (0, 2), (1, 0), (1, 0), (2, 0))
+
+## Bitmask of the cards that decide the dealer (the black jacks)
+BLACK_JACKS_MASK = sum(1 << card for card in range(len(CARD_STR)) if CARD_RANK[card] == "J" and CARD_SUIT[card] in (Suit.SPADES, Suit.CLUBS))
+
+RANK_SORT_ORDER = {"A": 1, "K": 2, "Q": 3, "J": 4, "10": 5, "9": 6}
+SUIT_SORT_OFFSET = {Suit.SPADES: 0, Suit.HEARTS: 6, Suit.CLUBS: 12, Suit.DIAMONDS: 18}
+
+def get_sort_key(card: Card, trump_suit: Suit, left_bower_suit: Suit) -> int:
+    """Returns the sort key of the card, ordering by suit then euchre-rank with trump (and both bowers) first
     
-    def get_card_string(self) -> str:
-        """Returns the string representation of the card"""
-        return f" {self.rank}{self.suit.value}"
+    Input Arguments:
+    card            -- the card to rank
+    trump_suit      -- the suit decided to be trump for this round
+    left_bower_suit -- the suit of the other Jack that is trump (if trump is SPADES, left bower is CLUBS)
+    """
+    rank = CARD_RANK[card]
+    suit = CARD_SUIT[card]
+    if rank == "J" and suit == trump_suit:
+        return -7
+    elif rank == "J" and suit == left_bower_suit:
+        return -6
+    elif suit == trump_suit:
+        return RANK_SORT_ORDER[rank] - 6
+    return RANK_SORT_ORDER[rank] + SUIT_SORT_OFFSET[suit]
+
+def get_sort_keys(trump_suit: Suit, left_bower_suit: Suit) -> tuple[int, ...]:
+    """Returns the sort key of every card, indexed by card"""
+    return tuple([get_sort_key(card, trump_suit, left_bower_suit) for card in range(len(CARD_STR))])
+
+## The sort key of every card for each trump suit
+SORT_KEYS = {trump_suit: get_sort_keys(trump_suit, LEFT_BOWER[trump_suit]) for trump_suit in Suit}
 
 class Deck:
-    def __init__(self, ranks: list[str], suits: list[Suit]):
+    __slots__ = ("cards", "cursor", "rng")
+
+    def __init__(self, rng: random.Random):
         """Deck class constructor to initialize the object
         
         Input Arguments:
-        ranks -- a list of the possible ranks for the deck
-        suits -- a list of the possible suits for the deck
+        rng -- the random number generator used to shuffle the deck
         """
-        self.base: list[Card] = []
-        for suit in suits:
-            for rank in ranks:
-                self.base.append(Card(rank, suit))
-        self.current: list[Card] = []
+        ## Every card is kept in cards; only cards[:cursor] are still in the deck, dealt from the end
+        self.cards = array("B", BASE_DECK)
+        self.cursor = 0
+        self.rng = rng
+    
+    @property
+    def current(self) -> array:
+        """Returns the cards still in the current deck"""
+        return self.cards[:self.cursor]
     
     def shuffle(self):
-        """Resets the current deck as a shuffled copy of the base deck"""
-        self.current = copy.deepcopy(self.base)
-        random.shuffle(self.current)
+        """Resets the current deck as a shuffled full deck"""
+        self.rng.shuffle(self.cards)
+        self.cursor = len(self.cards)
     
     def deal_one_card(self) -> Card:
         """Removes a card from the current deck"""
-        return self.current.pop()
+        if self.cursor < 1:
+            raise IndexError("deal from an empty deck")
+        self.cursor = self.cursor - 1
+        return self.cards[self.cursor]
+    
+    def deal_cards(self, num_cards: int) -> array:
+        """Removes several cards from the current deck, in the same order as repeated deal_one_card calls
+        
+        Input Arguments:
+        num_cards -- the number of cards to remove
+        """
+        if self.cursor < num_cards:
+            raise IndexError("deal from an empty deck")
+        cards = self.cards[self.cursor - num_cards:self.cursor]
+        cards.reverse()
+        self.cursor = self.cursor - num_cards
+        return cards
     
     def add_back_to_deck(self, card: Card):
         """Adds a card back to the current deck
@@ -61,14 +169,33 @@ class Deck:
         Input Arguments:
         card -- the card to add back to the current deck
         """
-        self.current.append(card)
+        ## Only search the dealt cards; array.index has no start argument before Python 3.10
+        index = self.cursor + self.cards[self.cursor:].index(card)
+        self.cards[index] = self.cards[self.cursor]
+        self.cards[self.cursor] = card
+        self.cursor = self.cursor + 1
+
+def get_trick_winner(cards_played: list[Card], lead_seat: int, trump_suit: Suit) -> int:
+    """Returns the seat that played the winning card of a complete trick
+    
+    Input Arguments:
+    cards_played -- a list of length 4 of the Card played by each seat
+    lead_seat    -- the seat that led suit
+    trump_suit   -- the trump suit
+    """
+    trick_ranks = TRICK_RANKS[trump_suit][cards_played[lead_seat]]
+    ranks = [trick_ranks[card] for card in cards_played]
+    return ranks.index(max(ranks))
 
 class Player:
+    __slots__ = ("hand", "seat_number", "partner_seat_number", "is_user", "trump_decision_logic", "card_decision_logic", "rng", "decide_trump", "choose_card")
+
     def __init__(self,
                  seat_number: int, 
                  is_user: bool = False, 
                  trump_decision_logic: PlayerTrumpDecision = PlayerTrumpDecision.ALWAYS_ACCEPT, 
-                 card_decision_logic: PlayerCardDecision = PlayerCardDecision.RANDOM):
+                 card_decision_logic: PlayerCardDecision = PlayerCardDecision.RANDOM,
+                 rng: random.Random = None):
         """Player class constructor to initialize the object
         
         Input Arguments:
@@ -76,231 +203,209 @@ class Player:
         is_player   -- boolean indicating whether the player is a human user
         trump_decision_logic -- the logic this player uses during the trump decision phase
         card_decision_logic  -- the logic this player uses during the trick taking phase
+        rng                  -- the random number generator behind the player's random decisions, a new one if None
         """
         self.hand: list[Card] = []
         self.seat_number = seat_number
-        self.partner_seat_number = (seat_number + 2) % 4
+        self.partner_seat_number = PARTNER_SEAT[seat_number]
         self.is_user = is_user
         self.trump_decision_logic = trump_decision_logic if trump_decision_logic is not None else PlayerTrumpDecision.ALWAYS_ACCEPT
         self.card_decision_logic = card_decision_logic if card_decision_logic is not None else PlayerCardDecision.RANDOM
+        self.rng = rng if rng is not None else random.Random()
+
+        ## Resolve the decision logic once into the methods the player calls every round
+        self.decide_trump = {
+            PlayerTrumpDecision.PLAYER : self.accept_up_card,
+            PlayerTrumpDecision.ALWAYS_ACCEPT : self.accept_up_card,
+            PlayerTrumpDecision.RANDOM : self.decide_trump_randomly,
+        }[self.trump_decision_logic]
+        self.choose_card = {
+            PlayerCardDecision.PLAYER : self.choose_last_card,
+            PlayerCardDecision.RANDOM : self.choose_random_card,
+        }[self.card_decision_logic]
     
     def add_card(self, card: Card):
         """Add a card to the player's hand"""
         self.hand.append(card)
 
-    def sort_hand(self, trump_suit: Suit, left_bower_suit: Suit):
+    def sort_hand(self, sort_keys: tuple[int, ...]):
         """Rearrange the player's hand in the order [SPADES, HEARTS, CLUBS, DIAMONDS] and appropriate trump order
         
         Input Arguments:
-        trump_suit      -- the suit decided to be trump for this round
-        left_bower_suit -- the suit of the other Jack that is trump (if trump is SPADES, left bower is CLUBS)
+        sort_keys -- the sort key of each card for this round, from SORT_KEYS
         """
-        def compare_trump(card : Card):
-            value = 0
-            if trump_suit and card.rank == "J":
-                if card.suit == trump_suit:
-                    value = -7
-                    return value
-                elif card.suit == left_bower_suit:
-                    value = -6
-                    return value
-
-            if card.rank == "A":
-                value = 1
-            elif card.rank == "K":
-                value = 2
-            elif card.rank == "Q":
-                value = 3
-            elif card.rank == "J":
-                value = 4
-            elif card.rank == "10":
-                value = 5
-            elif card.rank == "9":
-                value = 6
-
-            if card.suit == trump_suit:
-                value = value - 6
-            elif card.suit == Suit.SPADES:
-                value = value + 0
-            elif card.suit == Suit.HEARTS:
-                value = value + 6
-            elif card.suit == Suit.CLUBS:
-                value = value + 12
-            elif card.suit == Suit.DIAMONDS:
-                value = value + 18
-            
-            return value
-            
-        self.hand.sort(key = compare_trump)
+        self.hand.sort(key = sort_keys.__getitem__)
     
-    def decide_trump(self, up_card: Card, hidden_up_card: Card):
-        """Decide whether the player wishes to serve trump based on the trump decision logic, returns the suit if decided, None if passed
+    def accept_up_card(self, up_card: Card, hidden_up_card: Card):
+        """Trump decision logic that always serves the up card's suit as trump, returns the suit
         
         Input Arguments:
         up_card        -- the card being offered to determine trump suit
         hidden_up_card -- the now-hidden up_card which cannot be chosen as trump if previously passed on
         """
-        if self.trump_decision_logic == PlayerTrumpDecision.ALWAYS_ACCEPT:
-            return up_card.suit
-        elif self.trump_decision_logic == PlayerTrumpDecision.RANDOM:
-            if up_card:
-                return random.choice([up_card.suit, None])
-            else:
-                return random.choice([e.value for e in Suit if e != hidden_up_card.suit] + [None])
+        return CARD_SUIT[up_card]
 
-        return up_card.suit
+    def decide_trump_randomly(self, up_card: Card, hidden_up_card: Card):
+        """Trump decision logic that randomly serves or passes, returns the suit if decided, None if passed
+        
+        Input Arguments:
+        up_card        -- the card being offered to determine trump suit
+        hidden_up_card -- the now-hidden up_card which cannot be chosen as trump if previously passed on
+        """
+        if up_card is not None:
+            return CARD_SUIT[up_card] if self.rng.getrandbits(1) else None
+        choices = TRUMP_CHOICES_EXCLUDING[CARD_SUIT[hidden_up_card]]
+        return choices[int(self.rng.random() * len(choices))]
 
-    def play_card(self, trump_suit: Suit, left_bower_suit: Suit, lead_seat: int, cards_played: list[Card]):
-        """Decide which card the player will play based on the card decision logic, returns the Card
+    def play_card(self, trump_suit: Suit, lead_seat: int, cards_played: list[Card]):
+        """Decide which of the playable cards the player will play based on the card decision logic, returns the Card
         
         Input Arguments:
-        trump_suit      -- the trump suit
-        left_bower_suit -- the suit of the left bower
-        lead_seat       -- the seat that led suit
-        cards_played    -- an array of length 4 of Cards, None if the seat has not played yet
+        trump_suit   -- the trump suit
+        lead_seat    -- the seat that led suit
+        cards_played -- a list of length 4 of Cards, None if the seat has not played yet
         """
         lead_card = cards_played[lead_seat]
-        if not lead_card:
-            playable_cards = self.hand
+        if lead_card is None:
+            playable_indices = range(len(self.hand))
         else:
-            playable_cards = []
-
-            for card in self.hand:
-                if lead_card.suit == trump_suit and card.suit == left_bower_suit and card.rank == "J":
-                    playable_cards.append(card)
-                elif lead_card.suit == left_bower_suit and lead_card.rank == "J" and card.suit == trump_suit:
-                    playable_cards.append(card)
-                elif lead_card.suit == card.suit:
-                    if card.rank == "J" and card.suit == left_bower_suit:
-                        continue
-                    else:
-                        playable_cards.append(card)
+            follow_suit_mask = FOLLOW_SUIT_MASKS[trump_suit][lead_card]
+            playable_indices = [index for index, card in enumerate(self.hand) if follow_suit_mask >> card & 1]
             
-            if not playable_cards:
-                playable_cards = self.hand
+            if not playable_indices:
+                playable_indices = range(len(self.hand))
 
-        if self.card_decision_logic == PlayerCardDecision.RANDOM:
-            choice = random.choice(playable_cards)
-            self.hand.remove(choice)
-            return choice
+        return self.choose_card(playable_indices)
+
+    def choose_random_card(self, playable_indices: Sequence[int]) -> Card:
+        """Card decision logic that plays a random playable card, returns the Card
+        
+        Input Arguments:
+        playable_indices -- the positions in the hand of the cards that may be played
+        """
+        return self.hand.pop(playable_indices[int(self.rng.random() * len(playable_indices))])
+
+    def choose_last_card(self, playable_indices: Sequence[int]) -> Card:
+        """Card decision logic that plays the last card in the hand, returns the Card
         
+        Input Arguments:
+        playable_indices -- the positions in the hand of the cards that may be played
+        """
         return self.hand.pop()
 
 class EuchreTable:
+    __slots__ = ("test_mode", "interactive", "rng", "players", "deck", "dealer", "curr_seat", "up_card", "hidden_up_card", "trump_suit",
+                 "lead_seat", "trump_caller", "score_02", "score_13", "cards_played", "tricks_won_02", "tricks_won_13")
+
     def __init__(self, 
-                 trump_logic: dict[int, PlayerTrumpDecision] = {}, 
-                 play_logic: dict[int, PlayerCardDecision] = {},
-                 test_mode: bool = False):
+                 trump_logic: dict[int, PlayerTrumpDecision] = None, 
+                 play_logic: dict[int, PlayerCardDecision] = None,
+                 test_mode: bool = False,
+                 seed: int = None,
+                 interactive: bool = None):
         """EuchreTable class constructor to initialize the object
 
         Input Arguments:
-        trump_logic -- a dictionary holding each player's trump decision logic
-        play_logic  -- a dictionary holding each player decision logic for which card to play
+        trump_logic -- a dictionary holding each player's trump decision logic, None for the defaults
+        play_logic  -- a dictionary holding each player decision logic for which card to play, None for the defaults
         test_mode   -- boolean for whether to run the table in test mode, True if yes
+        seed        -- the seed for the table's random number generator, None to seed from the system
+        interactive -- boolean for whether to pause for the user between tricks and rounds, defaults to test_mode
         """
         self.test_mode = test_mode
-        self.players = {
-            0 : Player(0, False, trump_logic.get(0, None), play_logic.get(0, None)),
-            1 : Player(1, False, trump_logic.get(1, None), play_logic.get(1, None)),
-            2 : Player(2, False, trump_logic.get(2, None), play_logic.get(2, None)),
-            3 : Player(3, False, trump_logic.get(3, None), play_logic.get(3, None)),
-        }
-        ranks = ["9","10","J","Q","K","A"]
-        suits = [Suit.SPADES, Suit.HEARTS, Suit.CLUBS, Suit.DIAMONDS]
-        self.deck = Deck(ranks, suits)
+        self.interactive = interactive if interactive is not None else test_mode
+        self.rng = random.Random(seed)
+        trump_logic = trump_logic if trump_logic is not None else {}
+        play_logic = play_logic if play_logic is not None else {}
+        self.players = [Player(seat, False, trump_logic.get(seat, None), play_logic.get(seat, None), self.rng) for seat in range(4)]
+        self.deck = Deck(self.rng)
         self.dealer = 0
         self.curr_seat = 0
         self.up_card = None
         self.hidden_up_card = None
         self.trump_suit = None
-        self.left_bower_suit = None
         self.lead_seat = None
         self.trump_caller = None
         self.score_02 = 0
         self.score_13 = 0
-        self.cards_played = {0 : None, 1 : None, 2 : None, 3 : None}
+        self.cards_played = [None] * 4
         self.tricks_won_02 = 0
         self.tricks_won_13 = 0
     
-    def is_value_bigger(self, card1: Card, card2: Card):
-        """Returns True if the value of card1 is greater than card2"""
-        value1 = self.assign_card_value(card1)
-        value2 = self.assign_card_value(card2)
-        return value1 > value2
-    
-    def assign_card_value(self, card: Card):
-        """Returns the relative ranking of the card in euchre w/o trump"""
-        if card.rank == "9":
-            return 0
-        elif card.rank == "10":
-            return 1
-        elif card.rank == "J":
-            return 2
-        elif card.rank == "Q":
-            return 3
-        elif card.rank == "K":
-            return 4
-        elif card.rank == "A":
-            return 5
-        return 0
-
     def determine_dealer(self):
         """Runs the phase to determine the dealer - currently, the seat w/ the first black jack"""
         if self.test_mode: print("Determing Dealer...")
         curr_seat = 0
         self.deck.shuffle()
         curr_card = self.deck.deal_one_card()
-        if self.test_mode: print(f"({curr_seat % 4}){curr_card.get_card_string()}", end='')
+        if self.test_mode: print(f"({curr_seat}){CARD_STR[curr_card]}", end='')
 
-        while curr_card.rank != "J" or curr_card.suit not in (Suit.SPADES, Suit.CLUBS):
-            curr_seat = curr_seat + 1
+        while not (1 << curr_card) & BLACK_JACKS_MASK:
+            curr_seat = NEXT_SEAT[curr_seat]
             curr_card = self.deck.deal_one_card()
-            if self.test_mode: print(f" ({curr_seat % 4}){curr_card.get_card_string()}", end='')
+            if self.test_mode: print(f" ({curr_seat}){CARD_STR[curr_card]}", end='')
         
-        self.dealer = curr_seat % 4
-        self.curr_seat = (self.dealer + 1) % 4
+        self.dealer = curr_seat
+        self.curr_seat = NEXT_SEAT[self.dealer]
         if self.test_mode: print()
     
     def euchre_deal_cards(self):
         """Resets the deck and deals 5 cards to each player, in euchre-fashion"""
         self.deck.shuffle()
+        deal_cards = self.deck.deal_cards
         max_hand_size = 5
 
+        ## Outside of test mode nobody watches the deal, so each player simply takes the next 5 cards of the shuffled deck
+        if not self.test_mode:
+            for player in self.players:
+                player.hand[:] = deal_cards(max_hand_size)
+            self.up_card = self.deck.deal_one_card()
+            return
+
+        for player in self.players:
+            player.hand.clear()
+
+        dealer = self.players[self.dealer]
         num_cards_to_deal = 0
-        while len(self.players[self.dealer].hand) < max_hand_size:
+        while len(dealer.hand) < max_hand_size:
             player = self.players[self.curr_seat]
             if len(player.hand) == 0:
                 num_cards_to_deal = 2 if num_cards_to_deal == 3 else 3
             else:
                 num_cards_to_deal = max_hand_size - len(player.hand)
             
-            for _ in range(num_cards_to_deal):
-                player.add_card(self.deck.deal_one_card())
-            if self.test_mode: self.print_state()
+            player.hand.extend(deal_cards(num_cards_to_deal))
+            self.print_state()
             
-            self.curr_seat = (self.curr_seat + 1) % 4
+            self.curr_seat = NEXT_SEAT[self.curr_seat]
         
         self.up_card = self.deck.deal_one_card()
-        self.sort_player_hands()
-        if self.test_mode: self.print_state()
 
     def sort_player_hands(self):
-        """Sorts each of the player's hands in suit order then euchre-rank order"""
-        for player in self.players.values():
-            player.sort_hand(self.trump_suit, self.left_bower_suit)
+        """Sorts each of the player's hands in suit order then euchre-rank order
+        
+        A random computer player's hand is only sorted in test mode, where it is printed; its order changes nothing otherwise
+        """
+        players_to_sort = [player for player in self.players
+                           if self.test_mode or player.is_user or player.card_decision_logic != PlayerCardDecision.RANDOM]
+        if not players_to_sort:
+            return
+        sort_keys = SORT_KEYS[self.trump_suit]
+        for player in players_to_sort:
+            player.sort_hand(sort_keys)
     
     def determine_trump(self):
         """Runs the phase to determine the trump"""
-        self.curr_seat = (self.dealer + 1) % 4
+        self.curr_seat = NEXT_SEAT[self.dealer]
         self.trump_suit = self.players[self.curr_seat].decide_trump(self.up_card, self.hidden_up_card)
         
-        while not self.trump_suit:
-            print(f"Seat {self.curr_seat} passes.")
-            self.curr_seat = (self.curr_seat + 1) % 4
+        while self.trump_suit is None:
+            if self.test_mode: print(f"Seat {self.curr_seat} passes.")
+            self.curr_seat = NEXT_SEAT[self.curr_seat]
             
             ## All players passed on up card
-            if self.curr_seat == (self.dealer + 1) % 4:
-                if self.up_card:
+            if self.curr_seat == NEXT_SEAT[self.dealer]:
+                if self.up_card is not None:
                     self.hidden_up_card = self.up_card
                     self.deck.add_back_to_deck(self.up_card)
                     self.up_card = None
@@ -309,151 +414,132 @@ class EuchreTable:
             
             self.trump_suit = self.players[self.curr_seat].decide_trump(self.up_card, self.hidden_up_card)
         
-        if self.trump_suit == Suit.SPADES:
-            self.left_bower_suit = Suit.CLUBS
-        elif self.trump_suit == Suit.HEARTS:
-            self.left_bower_suit = Suit.DIAMONDS
-        elif self.trump_suit == Suit.CLUBS:
-            self.left_bower_suit = Suit.SPADES
-        elif self.trump_suit == Suit.DIAMONDS:
-            self.left_bower_suit = Suit.HEARTS
-        
         self.trump_caller = self.curr_seat
-        print(f"Seat {self.trump_caller} determined trump.")
+        if self.test_mode: print(f"Seat {self.trump_caller} determined trump.")
 
-        self.curr_seat = (self.dealer + 1) % 4
+        self.curr_seat = NEXT_SEAT[self.dealer]
         self.sort_player_hands()
         return True
 
     def play_trick(self):
         """Runs the phase to play a trick (1 card played by each player)"""
+        players = self.players
+        cards_played = self.cards_played
         num_cards_played = 0
         while num_cards_played < 4:
-            self.cards_played[self.curr_seat] = self.players[self.curr_seat].play_card(self.trump_suit, self.left_bower_suit, self.lead_seat, self.cards_played)
-            print("Table")
-            for player in self.cards_played:
-                print(f"{player} : {self.cards_played[player].get_card_string() if self.cards_played[player] else 'None'}")
-            self.curr_seat = (self.curr_seat + 1) % 4
+            player = players[self.curr_seat]
+            cards_played[self.curr_seat] = player.play_card(self.trump_suit, self.lead_seat, cards_played)
+            if self.test_mode:
+                print("Table")
+                for seat, card in enumerate(cards_played):
+                    print(f"{seat} : {CARD_STR[card] if card is not None else 'None'}")
+            self.curr_seat = NEXT_SEAT[self.curr_seat]
             num_cards_played = num_cards_played + 1
         self.process_trick()
-        input("Press Enter to continue...")
+        if self.interactive: input("Press Enter to continue...")
     
     def process_trick(self):
         """Determines which team won the trick and updates the number of tricks won appropriately"""
-        cards_processed = 0
-        seat_processing = self.lead_seat
-        winning_player = -1
-        while cards_processed < 4:
-            if seat_processing == self.lead_seat:
-                lead_suit = self.cards_played[self.lead_seat].suit
-            
-            if winning_player == -1:
-                winning_player = seat_processing
-            else:
-                if self.cards_played[winning_player].suit == self.trump_suit:
-                    if self.cards_played[winning_player].rank == "J":
-                        pass
-                    elif self.cards_played[seat_processing].suit == self.left_bower_suit and self.cards_played[seat_processing].rank == "J":
-                        ## Left Bower
-                        winning_player = seat_processing
-                    elif self.cards_played[seat_processing].suit == self.trump_suit:
-                        if self.is_value_bigger(self.cards_played[seat_processing], self.cards_played[winning_player]):
-                            winning_player = seat_processing
-                elif self.cards_played[winning_player].suit == self.left_bower_suit and self.cards_played[winning_player].rank == "J":
-                    if self.cards_played[seat_processing].suit == self.trump_suit and self.cards_played[seat_processing].rank == "J":
-                        winning_player = seat_processing
-                elif self.cards_played[seat_processing].suit == self.trump_suit:
-                    winning_player = seat_processing
-                elif self.cards_played[seat_processing].suit == self.left_bower_suit and self.cards_played[seat_processing].rank == "J":
-                    winning_player = seat_processing
-                else:
-                    if self.cards_played[seat_processing].suit == lead_suit:
-                        if self.is_value_bigger(self.cards_played[seat_processing], self.cards_played[winning_player]):
-                            winning_player = seat_processing
-            cards_processed = cards_processed + 1
-            seat_processing = (seat_processing + 1) % 4
+        winning_player = get_trick_winner(self.cards_played, self.lead_seat, self.trump_suit)
         
-        print(f"Player {winning_player} wins the trick")
+        if self.test_mode: print(f"Player {winning_player} wins the trick")
         if winning_player in (0,2):
             self.tricks_won_02 = self.tricks_won_02 + 1
         else:
             self.tricks_won_13 = self.tricks_won_13 + 1
         self.curr_seat = winning_player
-        print(f"[TRICKS] Team 02: {self.tricks_won_02} - Team 13: {self.tricks_won_13}")
+        if self.test_mode: print(f"[TRICKS] Team 02: {self.tricks_won_02} - Team 13: {self.tricks_won_13}")
     
     def play_round(self):
         """Runs the phase to play the euchre round, where each player plays each of the 5 cards"""
         self.euchre_deal_cards()
-        self.print_state()
+        if self.test_mode: self.print_state()
         if not self.determine_trump():
-            self.print_state()
-            input("No trump. Press Enter to continue...")
-            self.dealer = (self.dealer + 1) % 4
-            self.curr_seat = (self.dealer + 1) % 4
+            if self.test_mode: self.print_state()
+            if self.interactive: input("No trump. Press Enter to continue...")
+            self.dealer = NEXT_SEAT[self.dealer]
+            self.curr_seat = NEXT_SEAT[self.dealer]
             return
-        self.print_state()
+        if self.test_mode: self.print_state()
         
         self.tricks_won_02 = self.tricks_won_13 =  0
         while self.tricks_won_02 + self.tricks_won_13 < 5:
-            self.print_state()
+            if self.test_mode: self.print_state()
             self.lead_seat = self.curr_seat
-            self.cards_played = {0 : None, 1 : None, 2 : None, 3 : None}
+            for seat in range(4):
+                self.cards_played[seat] = None
             self.play_trick()
         self.process_round()
 
-        input("Press Enter to continue...")
-        self.dealer = (self.dealer + 1) % 4
-        self.curr_seat = (self.dealer + 1) % 4
+        if self.interactive: input("Press Enter to continue...")
+        self.dealer = NEXT_SEAT[self.dealer]
+        self.curr_seat = NEXT_SEAT[self.dealer]
     
     def process_round(self):
         """Determines who won the most tricks and updates the score appropriately"""
         if self.trump_caller in (0, 2):
-            if self.tricks_won_02 == 5:
-                self.score_02 = self.score_02 + 2
-            elif self.tricks_won_02 >= 3:
-                self.score_02 = self.score_02 + 1
-            else:
-                self.score_13 = self.score_13 + 2
+            points_02, points_13 = ROUND_SCORES[self.tricks_won_02]
         else:
-            if self.tricks_won_13 == 5:
-                self.score_13 = self.score_13 + 2
-            elif self.tricks_won_13 >= 3:
-                self.score_13 = self.score_13 + 1
-            else:
-                self.score_02 = self.score_02 + 2
+            points_13, points_02 = ROUND_SCORES[self.tricks_won_13]
+        self.score_02 = self.score_02 + points_02
+        self.score_13 = self.score_13 + points_13
         
-        print(f"[SCORE] Team 02: {self.score_02} - Team 13: {self.score_13}")
+        if self.test_mode: print(f"[SCORE] Team 02: {self.score_02} - Team 13: {self.score_13}")
 
     def print_state(self):
         """Prints the current state of the game"""
-        ## Print Game Info
-        print(f"Dealer: Player {self.dealer}")
-        if self.trump_suit: print(f"Seat {self.curr_seat} turn")
+        lines = []
+
+        ## Game Info
+        lines.append(f"Dealer: Player {self.dealer}")
+        if self.trump_suit is not None: lines.append(f"Seat {self.curr_seat} turn")
         
-        ## Print Deck
-        deck_info = "Deck :"
-        for card in self.deck.current:
-            deck_info = deck_info + card.get_card_string()
-        print(deck_info)
+        ## Deck
+        lines.append("Deck :" + "".join([CARD_STR[card] for card in self.deck.current]))
         
-        ## Print Hands
-        for player_no, player in self.players.items():
-            player_info = f"{player_no} :"
-            for card in player.hand:
-                player_info = player_info + card.get_card_string()
-            print(player_info)
+        ## Hands
+        for player_no, player in enumerate(self.players):
+            lines.append(f"{player_no} :" + "".join([CARD_STR[card] for card in player.hand]))
         
-        ## Print Up-Card or Trump
-        if self.trump_suit: 
-            print(f"Trump: {self.trump_suit}")
-        elif self.up_card: 
-            print(f"Up Card: {self.up_card.get_card_string()}")
+        ## Up-Card or Trump
+        if self.trump_suit is not None: 
+            lines.append(f"Trump: {SUIT_GLYPH[self.trump_suit]}")
+        elif self.up_card is not None: 
+            lines.append(f"Up Card: {CARD_STR[self.up_card]}")
+        
+        print("\n".join(lines))
     
     def play(self):
         """Plays a game of euchre until a team has 10 points"""
         self.determine_dealer()
         while self.score_02 < 10 and self.score_13 < 10:
             self.play_round()
+    
+    @classmethod
+    def simulate_batch(cls,
+                       num_games: int,
+                       trump_logic: dict[int, PlayerTrumpDecision] = None,
+                       play_logic: dict[int, PlayerCardDecision] = None,
+                       seed: int = None) -> tuple[int, int]:
+        """Plays num_games games of euchre on a single table without any output, returns the number of games won by each team
+        
+        Input Arguments:
+        num_games   -- the number of games to play
+        trump_logic -- a dictionary holding each player's trump decision logic, None for the defaults
+        play_logic  -- a dictionary holding each player decision logic for which card to play, None for the defaults
+        seed        -- the seed for the table's random number generator, None to seed from the system
+        """
+        table = cls(trump_logic, play_logic, False, seed)
+        games_won_02 = 0
+        games_won_13 = 0
+        for _ in range(num_games):
+            table.score_02 = table.score_13 = 0
+            table.play()
+            if table.score_02 >= 10:
+                games_won_02 = games_won_02 + 1
+            else:
+                games_won_13 = games_won_13 + 1
+        return games_won_02, games_won_13
 
 def main():
     """The main body that initializes the game and plays"""